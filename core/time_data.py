@@ -83,9 +83,17 @@ class TimeData:
         self.file_id = None
         self.current_session_start = None
         self.data_loaded = False  # このフラグは必要
+        # 作成日時の表示用キャッシュ: (タイムスタンプ, フォーマット済み文字列)
+        self._creation_time_cache = (None, "")
+        # データが変わるたびに進める（ステータスバーの表示キャッシュ無効化用）
+        self.revision = 0
 
         log.debug("TimeData initialized")
 
+    def invalidate_display(self):
+        """時間表示のキャッシュを無効化し、次の描画で再計算させる"""
+        self.revision += 1
+
     def reset(self):
         """すべてのデータをデフォルト値にリセットする"""
         self.total_time = 0
@@ -93,6 +101,7 @@ class TimeData:
         self.sessions = []
         self.file_creation_time = time.time()
         self.current_session_start = None
+        self.invalidate_display()
 
     def ensure_loaded(self):
         """データが読み込まれていることを保証する（Blenderが完全に初期化された後で安全に呼び出せる）"""
@@ -131,6 +140,7 @@ class TimeData:
             f"Started session #{session_id} at "
             f"{datetime.datetime.fromtimestamp(self.current_session_start)}"
         )
+        self.invalidate_display()
         return session_id
 
     def switch_session(self):
@@ -174,6 +184,7 @@ class TimeData:
 
         # 現在のセッション開始時間も更新
         self.current_session_start = current_session["start"]
+        self.invalidate_display()
 
         # データを保存
         self.save_data()
@@ -201,6 +212,7 @@ class TimeData:
                 session.get("duration", 0) for session in self.sessions
             )
             log.info(f"Updated total time: {format_time(self.total_time)}")
+            self.invalidate_display()
 
         return ended_count
 
@@ -315,6 +327,8 @@ class TimeData:
                 f"No existing time data found for {self.file_id}, using new data"
             )
 
+        self.invalidate_display()
+
     def update_session(self):
         """現在のセッションの継続時間を更新する"""
         current_session = self.get_current_session()
@@ -365,28 +379,42 @@ class TimeData:
         else:
             log.error("Failed to create or access text block for saving")
 
-    def get_current_session_time(self):
-        """現在のセッションで費やした時間を取得する"""
+    def get_current_session_time(self, now=None):
+        """現在のセッションで費やした時間を取得する（nowを渡すと時刻の再取得を省略）"""
         current_session = self.get_current_session()
         if current_session:
-            return time.time() - current_session["start"]
+            if now is None:
+                now = time.time()
+            return now - current_session["start"]
         return 0
 
-    def get_time_since_last_save(self):
-        """最後に保存してからの経過時間を取得する"""
-        return time.time() - self.last_save_time
+    def get_time_since_last_save(self, now=None):
+        """最後に保存してからの経過時間を取得する（nowを渡すと時刻の再取得を省略）"""
+        if now is None:
+            now = time.time()
+        return now - self.last_save_time
 
     def get_formatted_total_time(self):
         """合計時間をフォーマットして取得する"""
         return format_time(self.total_time)
 
-    def get_formatted_session_time(self):
+    def get_formatted_session_time(self, now=None):
         """セッション時間をフォーマットして取得する"""
-        return format_time(self.get_current_session_time())
+        return format_time(self.get_current_session_time(now))
 
-    def get_formatted_time_since_save(self):
+    def get_formatted_time_since_save(self, now=None):
         """最後の保存からの経過時間をフォーマットして取得する"""
-        return format_time(self.get_time_since_last_save())
+        return format_time(self.get_time_since_last_save(now))
+
+    def get_formatted_creation_time(self):
+        """ファイル作成日時をフォーマットして取得する（タイムスタンプが変わるまでキャッシュ）"""
+        cached_time, cached_str = self._creation_time_cache
+        if cached_time != self.file_creation_time:
+            cached_str = datetime.datetime.fromtimestamp(
+                self.file_creation_time
+            ).strftime("%Y-%m-%d %H:%M")
+            self._creation_time_cache = (self.file_creation_time, cached_str)
+        return cached_str
 
     def format_time(self, seconds):
         """秒数を人間が読みやすい形式にフォーマットする"""
@@ -17,6 +17,30 @@ from ..utils.formatting import format_time
 
 # log = get_logger(__name__)
 
+# Constants
+EXPORT_SESSIONS_PER_TICK = 50  # モーダルエクスポートで1ティックに処理するセッション数
+EXPORT_TICK_INTERVAL = 0.02  # モーダルエクスポートのタイマー間隔（秒）
+
+REPORT_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+REPORT_HEADER_TEMPLATE = (
+    "# Work Time Report for {filename}\n"
+    "Generated: {generated}\n"
+    "File created: {created}\n"
+    "File ID: {file_id}\n\n"
+    "## Summary\n"
+    "- Total work time: {total_time}\n"
+    "- Current session: {session_time}\n"
+    "- Time since last save: {time_since_save}\n\n"
+    "## Session History\n"
+)
+REPORT_SESSION_TEMPLATE = (
+    "### Session {number}\n"
+    "- Start: {start}\n"
+    "- End: {end}\n"
+    "- Duration: {duration}\n"
+    "{comment}\n"
+)
+
 
 class TIMETRACKER_OT_edit_comment(Operator):
     """セッションコメントを編集"""
@@ -111,6 +135,53 @@ class TIMETRACKER_OT_reset_data(Operator):
         return context.window_manager.invoke_confirm(self, event)
 
 
+def _format_report_header(time_data, current_time, now):
+    """レポートのヘッダーとサマリー部分を生成する"""
+    # Get file name
+    if bpy.data.filepath:
+        filename = bpy.path.basename(bpy.data.filepath)
+    else:
+        filename = "Unsaved File"
+
+    # Get creation date
+    creation_date = datetime.datetime.fromtimestamp(time_data.file_creation_time)
+
+    return REPORT_HEADER_TEMPLATE.format(
+        filename=filename,
+        generated=current_time.strftime(REPORT_DATETIME_FORMAT),
+        created=creation_date.strftime(REPORT_DATETIME_FORMAT),
+        file_id=time_data.file_id,
+        total_time=time_data.get_formatted_total_time(),
+        session_time=time_data.get_formatted_session_time(now),
+        time_since_save=time_data.get_formatted_time_since_save(now),
+    )
+
+
+def _format_report_session(index, session, now):
+    """レポートの1セッション分のエントリを生成する"""
+    start_time = datetime.datetime.fromtimestamp(session["start"]).strftime(
+        REPORT_DATETIME_FORMAT
+    )
+
+    if session.get("end") is None:
+        end_time = "Active"
+        duration = now - session["start"]
+    else:
+        end_time = datetime.datetime.fromtimestamp(session["end"]).strftime(
+            REPORT_DATETIME_FORMAT
+        )
+        duration = session["duration"]
+
+    comment = session.get("comment")
+    return REPORT_SESSION_TEMPLATE.format(
+        number=index + 1,
+        start=start_time,
+        end=end_time,
+        duration=format_time(duration),
+        comment=f"- Comment: {comment}\n" if comment else "",
+    )
+
+
 class TIMETRACKER_OT_export_data(Operator):
     """Export time tracking data"""
 
@@ -118,72 +189,104 @@ class TIMETRACKER_OT_export_data(Operator):
     bl_label = "Export Time Report"
     bl_description = "Export time tracking data to a text file"
 
+    _timer = None
+    _timer_tick = 0.0
+    _sessions = None
+    _buffer = None
+    _index = 0
+    _now = 0.0
+    _report_name = ""
+
+    def _begin(self, time_data):
+        """レポート生成の状態を初期化する"""
+        current_time = datetime.datetime.now()
+        self._report_name = (
+            f"WorkTimeReport_{current_time.strftime('%Y%m%d_%H%M%S')}.md"
+        )
+        # 生成中にセッションが追加されても影響しないようにスナップショットを取る
+        self._now = time.time()
+        self._sessions = list(time_data.sessions)
+        self._buffer = [_format_report_header(time_data, current_time, self._now)]
+        self._index = 0
+
+    def _step(self, count):
+        """最大count件のセッションをフォーマットし、完了したらTrueを返す"""
+        end = min(self._index + count, len(self._sessions))
+        for i in range(self._index, end):
+            self._buffer.append(_format_report_session(i, self._sessions[i], self._now))
+        self._index = end
+        return end >= len(self._sessions)
+
+    def _write_report(self):
+        """バッファをテキストブロックに一括で書き込む"""
+        report = bpy.data.texts.new(self._report_name)
+        report.write("".join(self._buffer))
+        self.report({"INFO"}, f"Report exported to text editor: {self._report_name}")
+
+    def _finish(self, context):
+        """タイマーと進捗表示を片付ける"""
+        wm = context.window_manager
+        if self._timer:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+            wm.progress_end()
+        self._sessions = None
+        self._buffer = None
+
     def execute(self, context):
         # TimeDataManagerからインスタンスを取得
         time_data = TimeDataManager.get_instance()
         if time_data:
-            # Create a report
-            current_time = datetime.datetime.now()
-            report_name = f"WorkTimeReport_{current_time.strftime('%Y%m%d_%H%M%S')}.md"
-            report = bpy.data.texts.new(report_name)
-
-            # Get file name
-            if bpy.data.filepath:
-                filename = bpy.path.basename(bpy.data.filepath)
-            else:
-                filename = "Unsaved File"
-
-            # Get creation date
-            creation_date = datetime.datetime.fromtimestamp(
-                time_data.file_creation_time
-            )
-
-            # Write report header
-            report.write(f"# Work Time Report for {filename}\n")
-            report.write(f"Generated: {current_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            report.write(
-                f"File created: {creation_date.strftime('%Y-%m-%d %H:%M:%S')}\n"
-            )
-            report.write(f"File ID: {time_data.file_id}\n\n")
-
-            # Write summary
-            report.write("## Summary\n")
-            report.write(f"- Total work time: {time_data.get_formatted_total_time()}\n")
-            report.write(
-                f"- Current session: {time_data.get_formatted_session_time()}\n"
-            )
-            report.write(
-                f"- Time since last save: "
-                f"{time_data.get_formatted_time_since_save()}\n\n"
-            )
-
-            # Write detailed session info
-            report.write("## Session History\n")
-            for i, session in enumerate(time_data.sessions):
-                start_time = datetime.datetime.fromtimestamp(session["start"]).strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                )
-
-                if session.get("end") is None:
-                    end_time = "Active"
-                    duration = time.time() - session["start"]
-                else:
-                    end_time = datetime.datetime.fromtimestamp(session["end"]).strftime(
-                        "%Y-%m-%d %H:%M:%S"
-                    )
-                    duration = session["duration"]
-
-                formatted_duration = format_time(duration)
-                report.write(f"### Session {i + 1}\n")
-                report.write(f"- Start: {start_time}\n")
-                report.write(f"- End: {end_time}\n")
-                report.write(f"- Duration: {formatted_duration}\n")
-
-                if session.get("comment"):
-                    report.write(f"- Comment: {session['comment']}\n")
-
-                report.write("\n")
-
-            self.report({"INFO"}, f"Report exported to text editor: {report_name}")
+            self._begin(time_data)
+            self._step(len(self._sessions))
+            self._write_report()
             return {"FINISHED"}
         return {"CANCELLED"}
+
+    def invoke(self, context, event):
+        # TimeDataManagerからインスタンスを取得
+        time_data = TimeDataManager.get_instance()
+        if not time_data:
+            return {"CANCELLED"}
+
+        # セッション数が少なければモーダルにする必要はない
+        if len(time_data.sessions) <= EXPORT_SESSIONS_PER_TICK:
+            return self.execute(context)
+
+        self._begin(time_data)
+
+        wm = context.window_manager
+        wm.progress_begin(0, len(self._sessions))
+        self._timer = wm.event_timer_add(EXPORT_TICK_INTERVAL, window=context.window)
+        self._timer_tick = self._timer.time_duration
+        wm.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        if event.type == "ESC":
+            self._finish(context)
+            self.report({"WARNING"}, "Report export cancelled")
+            return {"CANCELLED"}
+
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
+
+        # Eventからは発火元のタイマーが分からないため、自分のタイマーの経過時間が
+        # 進んだ時だけ処理する（Timeoutなど他のタイマーでは進めない）
+        tick = self._timer.time_duration
+        if tick == self._timer_tick:
+            return {"PASS_THROUGH"}
+        self._timer_tick = tick
+
+        done = self._step(EXPORT_SESSIONS_PER_TICK)
+        context.window_manager.progress_update(self._index)
+        if not done:
+            return {"RUNNING_MODAL"}
+
+        self._write_report()
+        self._finish(context)
+        return {"FINISHED"}
+
+    def cancel(self, context):
+        # ファイル読み込みなどでBlender側からモーダルが中断された場合
+        self._finish(context)
@@ -2,18 +2,22 @@
 UIパネルモジュール - 時間トラッカーのUIパネルを提供
 """
 
-import datetime
+import time
 
 from bpy.types import Panel, STATUSBAR_HT_header
 
 from ..core.time_data import TimeDataManager
-from ..utils.formatting import format_hours_minutes
+from ..utils.formatting import format_hours_minutes, format_time
 from ..utils.logging import get_logger
 
 log = get_logger(__name__)
 
 # Constants
 UNSAVED_WARNING_THRESHOLD = 10 * 60  # 10 minutes in seconds
+STATUSBAR_REFRESH_INTERVAL = 0.2  # ステータスバーの時間を再計算する最短間隔（秒）
+
+# ステータスバー表示用キャッシュ（表示は分単位なので分が変わった時だけ再生成する）
+_status_cache = {"key": None, "text": "", "checked": 0.0, "revision": None}
 
 
 class VIEW3D_PT_time_tracker(Panel):
@@ -36,92 +40,87 @@ class VIEW3D_PT_time_tracker(Panel):
             layout.label(text="Time tracker not initialized")
             return
 
-        if time_data:
-            # Ensure data is loaded
+        # Ensure data is loaded（読み込み済みならメソッド呼び出し自体を省略）
+        if not time_data.data_loaded:
             time_data.ensure_loaded()
 
-            # Display total time
-            row = layout.row()
-            row.label(text="Total Work Time:")
-            row.label(text=time_data.get_formatted_total_time())
-
-            # Display current session time
-            row = layout.row()
-            row.label(text="Current Session:")
-            row.label(text=time_data.get_formatted_session_time())
-
-            # Display time since last save
-            time_since_save = time_data.get_time_since_last_save()
-            row = layout.row()
-            row.label(text="Time Since Save:")
-
-            # Show warning if unsaved for too long
-            if (
-                context.blend_data.is_dirty
-                and time_since_save > UNSAVED_WARNING_THRESHOLD
-            ):
-                # row_alert = layout.row()
-                row.alert = True
-                row.label(text=f"{time_data.get_formatted_time_since_save()}")
-                row_alert = layout.row()
-                row_alert.alert = True
-                row_alert.label(text="Consider saving your work!")
-            else:
-                row.label(text=time_data.get_formatted_time_since_save())
-
-            box = layout.box()
-            row = box.row()
-            row.label(text="Session Info:", icon="TEXT")
-
-            # コメント表示/編集
-            current_comment = time_data.get_session_comment()
-            if current_comment:
-                row = box.row()
-                row.label(text=current_comment, icon="SMALL_CAPS")
+        # 描画中の時刻はここで一度だけ取得する
+        now = time.time()
+
+        # ラベルと値のペアは行ごとにレイアウトを作らず、2列のフローにまとめる
+        flow = layout.grid_flow(row_major=True, columns=2, even_columns=True)
+
+        # Display total time
+        flow.label(text="Total Work Time:")
+        flow.label(text=time_data.get_formatted_total_time())
+
+        # Display current session time
+        flow.label(text="Current Session:")
+        flow.label(text=time_data.get_formatted_session_time(now))
+
+        # Display time since last save
+        time_since_save = time_data.get_time_since_last_save(now)
+        time_since_save_str = format_time(time_since_save)
+        flow.label(text="Time Since Save:")
+
+        # Show warning if unsaved for too long
+        if context.blend_data.is_dirty and time_since_save > UNSAVED_WARNING_THRESHOLD:
+            # 値のセルだけを赤く表示する
+            sub = flow.row()
+            sub.alert = True
+            sub.label(text=time_since_save_str)
+            row_alert = layout.row()
+            row_alert.alert = True
+            row_alert.label(text="Consider saving your work!")
+        else:
+            flow.label(text=time_since_save_str)
+
+        box = layout.box()
+        row = box.row()
+        row.label(text="Session Info:", icon="TEXT")
+
+        # コメント表示/編集
+        current_comment = time_data.get_session_comment()
+        if current_comment:
             row = box.row()
-            row.operator(
-                "timetracker.edit_comment", text="Edit Comment", icon="GREASEPENCIL"
-            )
+            row.label(text=current_comment, icon="SMALL_CAPS")
+        row = box.row()
+        row.operator(
+            "timetracker.edit_comment", text="Edit Comment", icon="GREASEPENCIL"
+        )
+
+        # File info
+        if time_data.file_id:
+            layout.separator()
+            row = layout.row()
+            row.label(text=f"File ID: {time_data.file_id}")
 
-            # File info
-            if time_data.file_id:
-                layout.separator()
+            if time_data.file_creation_time:
                 row = layout.row()
-                row.label(text=f"File ID: {time_data.file_id}")
-
-                if time_data.file_creation_time:
-                    creation_time = datetime.datetime.fromtimestamp(
-                        time_data.file_creation_time
-                    )
-                    row = layout.row()
-                    row.label(
-                        text=f"Created: {creation_time.strftime('%Y-%m-%d %H:%M')}"
-                    )
-
-            # layout.separator()
-            layout.operator(
-                "timetracker.switch_session", text="New Session", icon="FILE_REFRESH"
+                row.label(text=f"Created: {time_data.get_formatted_creation_time()}")
+
+        # layout.separator()
+        layout.operator(
+            "timetracker.switch_session", text="New Session", icon="FILE_REFRESH"
+        )
+        layout.operator("timetracker.export_data", text="Export Report", icon="TEXT")
+
+        # layout.separator()
+        header, sub_panel = layout.panel(
+            idname="time_tracker_subpanel", default_closed=True
+        )
+        header.label(text="Reset Data", icon="ERROR")
+        if sub_panel:
+            sub_panel.operator(
+                "timetracker.reset_session",
+                text="Reset Current Session",
+                icon="CANCEL",
             )
-            layout.operator(
-                "timetracker.export_data", text="Export Report", icon="TEXT"
+            sub_panel.alert = True
+            sub_panel.operator(
+                "timetracker.reset_data", text="Reset All Session", icon="ERROR"
             )
 
-            # layout.separator()
-            header, sub_panel = layout.panel(
-                idname="time_tracker_subpanel", default_closed=True
-            )
-            header.label(text="Reset Data", icon="ERROR")
-            if sub_panel:
-                sub_panel.operator(
-                    "timetracker.reset_session",
-                    text="Reset Current Session",
-                    icon="CANCEL",
-                )
-                sub_panel.alert = True
-                sub_panel.operator(
-                    "timetracker.reset_data", text="Reset All Session", icon="ERROR"
-                )
-
 
 def time_tracker_draw(self, context):
     """ステータスバーに時間情報を表示"""
@@ -134,21 +133,38 @@ def time_tracker_draw(self, context):
     layout = self.layout
     row = layout.row(align=True)
 
-    total_time_str = format_hours_minutes(time_data.total_time)
-    session_time_str = format_hours_minutes(time_data.get_current_session_time())
-
-    compact_text = f"{total_time_str} | {session_time_str}"
-
-    row.popover(panel="VIEW3D_PT_time_tracker", text=compact_text, icon="TIME")
+    now = time.time()
+
+    # 再描画が集中しても時間の再計算は一定間隔ごとに抑える
+    # （リセットやセッション切り替えなどでデータが変わった場合は即座に再計算）
+    tick = time.monotonic()
+    if (
+        time_data.revision != _status_cache["revision"]
+        or tick - _status_cache["checked"] >= STATUSBAR_REFRESH_INTERVAL
+    ):
+        _status_cache["checked"] = tick
+        _status_cache["revision"] = time_data.revision
+        total_time = time_data.total_time
+        session_time = time_data.get_current_session_time(now)
+
+        key = (int(total_time) // 60, int(session_time) // 60)
+        if key != _status_cache["key"]:
+            total_time_str = format_hours_minutes(total_time)
+            session_time_str = format_hours_minutes(session_time)
+            _status_cache["key"] = key
+            _status_cache["text"] = f"{total_time_str} | {session_time_str}"
+
+    row.popover(panel="VIEW3D_PT_time_tracker", text=_status_cache["text"], icon="TIME")
 
     row.separator()
 
-    time_since_save = time_data.get_time_since_last_save()
-    if not context.blend_data.is_saved:
+    time_since_save = time_data.get_time_since_last_save(now)
+    blend_data = context.blend_data
+    if not blend_data.is_saved:
         row_alert = row.row(align=True)
         row_alert.alert = True
         row_alert.label(text="Unsaved File", icon="ERROR")
-    elif context.blend_data.is_dirty and time_since_save > UNSAVED_WARNING_THRESHOLD:
+    elif blend_data.is_dirty and time_since_save > UNSAVED_WARNING_THRESHOLD:
         row_alert = row.row(align=True)
         row_alert.alert = True
         row_alert.label(text="Save Pending", icon="ERROR")
@@ -2,6 +2,11 @@
 時間フォーマット用ユーティリティ
 """
 
+from functools import lru_cache
+
+# ゼロ埋め済みの2桁文字列テーブル（分・秒と100時間未満の時間に使用）
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(100))
+
 
 def format_time(seconds):
     """
@@ -13,9 +18,15 @@ def format_time(seconds):
     Returns:
         str: HH:MM:SS形式の文字列
     """
-    hours, remainder = divmod(int(seconds), 3600)
+    # 整数秒をキーにしてキャッシュする（同じ秒数は毎フレーム繰り返し描画されるため）
+    return _format_time(int(seconds))
+
+
+@lru_cache(maxsize=1024)
+def _format_time(seconds):
+    hours, remainder = divmod(seconds, 3600)
     minutes, seconds = divmod(remainder, 60)
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    return f"{_hours_str(hours)}:{_TWO_DIGITS[minutes]}:{_TWO_DIGITS[seconds]}"
 
 
 def format_hours_minutes(seconds):
@@ -28,6 +39,16 @@ def format_hours_minutes(seconds):
     Returns:
         str: HH:MM形式の文字列
     """
-    hours, remainder = divmod(int(seconds), 3600)
-    minutes, _ = divmod(remainder, 60)
-    return f"{hours:02d}:{minutes:02d}"
+    # 表示は分単位なので、分をキーにしてキャッシュする
+    return _format_hours_minutes(int(seconds) // 60)
+
+
+@lru_cache(maxsize=1024)
+def _format_hours_minutes(total_minutes):
+    hours, minutes = divmod(total_minutes, 60)
+    return f"{_hours_str(hours)}:{_TWO_DIGITS[minutes]}"
+
+
+def _hours_str(hours):
+    # 時間は上限がないため、テーブル外の値は通常のフォーマットに戻す
+    return _TWO_DIGITS[hours] if 0 <= hours < 100 else f"{hours:02d}"
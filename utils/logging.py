@@ -14,6 +14,14 @@ class LogLevel(IntEnum):
     ERROR = 3
 
 
+_LEVEL_NAMES = {
+    "debug": LogLevel.DEBUG,
+    "info": LogLevel.INFO,
+    "warning": LogLevel.WARNING,
+    "error": LogLevel.ERROR,
+}
+
+
 class Log:
     """Simple logger with color output and configurable level/output."""
 
@@ -30,13 +38,7 @@ class Log:
     def set_level(cls, level: Union[str, LogLevel]):
         """Log level: 'debug', 'info', 'warning', 'error'"""
         if isinstance(level, str):
-            level_map = {
-                "debug": LogLevel.DEBUG,
-                "info": LogLevel.INFO,
-                "warning": LogLevel.WARNING,
-                "error": LogLevel.ERROR,
-            }
-            cls._level = level_map.get(level.lower(), LogLevel.DEBUG)
+            cls._level = _LEVEL_NAMES.get(level.lower(), LogLevel.DEBUG)
         else:
             cls._level = level
 
@@ -50,7 +52,10 @@ class Log:
         if level < cls._level:
             return
 
-        msg = ", ".join(str(arg) for arg in args)
+        if len(args) == 1 and isinstance(args[0], str):
+            msg = args[0]
+        else:
+            msg = ", ".join(map(str, args))
 
         try:
             if cls._output:
@@ -68,7 +73,6 @@ class Log:
 
     @classmethod
     def info(cls, *args):
-        cls._log(LogLevel.INFO, "")
         cls._log(LogLevel.INFO, *args)
 
     @classmethod
@@ -1,5 +1,6 @@
 from typing import Dict
-import time
+import itertools
+from time import monotonic
 
 import bpy
 from bpy.types import Operator
@@ -9,12 +10,14 @@ from ..addon import ADDON_PREFIX, ADDON_PREFIX_PY
 
 
 class Timer:
+    __slots__ = ("duration", "remaining_time", "start_time", "_inv_duration")
+
     def __init__(self, duration):
         self.duration = duration
         self.reset(duration)
 
     def update(self):
-        current_time = time()
+        current_time = monotonic()
         elapsed_time = current_time - self.start_time
         self.remaining_time -= elapsed_time
         self.start_time = current_time
@@ -24,7 +27,8 @@ class Timer:
     def reset(self, duration):
         self.duration = duration
         self.remaining_time = duration
-        self.start_time = time()
+        self.start_time = monotonic()
+        self._inv_duration = 1.0 / duration if duration else 0.0
 
     # def remaining_percentage(self):
     #     # Transitions from 100 to 0
@@ -32,7 +36,13 @@ class Timer:
 
     def elapsed_ratio(self):
         """Returns the ratio of elapsed time to total duration."""
-        return max(0, min(1, (self.duration - self.remaining_time) / self.duration))
+        if not self.duration:
+            # A zero-length timer is finished from the start
+            return 1.0
+        return max(
+            0.0,
+            min(1.0, (self.duration - self.remaining_time) * self._inv_duration),
+        )
 
     def is_finished(self):
         return self.remaining_time <= 0
@@ -55,6 +65,7 @@ class Timeout:
     delay: FloatProperty(default=0.0001, options={"SKIP_SAVE", "HIDDEN"})
 
     _data: Dict[int, tuple] = dict()  # タイムアウト関数のデータ保持用
+    _id_gen = itertools.count()  # タイムアウトIDの採番用
     _timer = None
     _finished = False
 
@@ -99,8 +110,6 @@ def timeout(func: callable, *args) -> None:
         func: 実行する関数
         *args: 関数に渡す引数
     """
-    idx = len(Timeout._data)
-    while idx in Timeout._data:
-        idx += 1
+    idx = next(Timeout._id_gen)
     Timeout._data[idx] = (func, args)
     getattr(bpy.ops, ADDON_PREFIX_PY).timeout(idx=idx)
@@ -1,3 +1,5 @@
+import functools
+import re
 import textwrap
 
 import bpy
@@ -13,6 +15,14 @@ log = get_logger(__name__)
 
 
 ICON_ENUM_ITEMS = UILayout.bl_rna.functions["prop"].parameters["icon"].enum_items
+# ic() の存在確認用（RNAコレクションを毎回走査しないよう、読み込み時に名前をセット化）
+_ICON_NAMES = frozenset(ICON_ENUM_ITEMS.keys())
+
+ICON_ALTERNATIVES = {
+    "GREASEPENCIL_LAYER_GROUP": "TEXT",
+    "EVENT_NDOF_BUTTON_1": "ONIONSKIN_ON",
+    "KEY_BACKSPACE": "BACK",
+}
 
 
 def _indented_layout(layout, level):
@@ -60,60 +70,147 @@ class CopyTextToClipboard:
         return {"FINISHED"}
 
 
-# CopyTextToClipboardOperator = type(
-#     f"{ADDON_PREFIX}_OT_copy_text_to_clipboard",
-#     (CopyTextToClipboard, bpy.types.Operator),
-#     {},
-# )
+CopyTextToClipboardOperator = type(
+    f"{ADDON_PREFIX}_OT_copy_text_to_clipboard",
+    (CopyTextToClipboard, Operator),
+    {},
+)
+
+# コピーボタンのオペレーターID（描画のたびにクラス属性を引かないよう定数化）
+_COPY_IDNAME = CopyTextToClipboard.bl_idname
+
+
+_ic_cache = {}  # ic() の解決結果キャッシュ（アイコン一覧は実行中に変わらない）
 
 
 def ic(icon):
     if not icon:
         return icon
 
-    if icon in ICON_ENUM_ITEMS:
+    resolved = _ic_cache.get(icon)
+    if resolved is None:
+        resolved = _ic_cache[icon] = _resolve_icon(icon)
+    return resolved
+
+
+def _resolve_icon(icon):
+    if icon in _ICON_NAMES:
         return icon
 
     if icon.startswith("SEQUENCE_COLOR_"):  # 4.4+
         return icon.replace("SEQUENCE_COLOR_", "STRIP_COLOR_")
 
-    ICON_ALTERNATIVES = {
-        "GREASEPENCIL_LAYER_GROUP": "TEXT",
-        "EVENT_NDOF_BUTTON_1": "ONIONSKIN_ON",
-        "KEY_BACKSPACE": "BACK",
-    }
-
-    if icon in ICON_ALTERNATIVES:
-        alt_icon = ICON_ALTERNATIVES[icon]
+    alt_icon = ICON_ALTERNATIVES.get(icon)
+    if alt_icon is not None:
         return alt_icon
 
     log.warning(f"Icon not found: {icon}")
     return "BLENDER"
 
 
+# トグル用アイコンは (False, True) の組として読み込み時に解決しておく
+_IC_RB = (ic("RADIOBUT_OFF"), ic("RADIOBUT_ON"))
+_IC_CB = (ic("CHECKBOX_DEHLT"), ic("CHECKBOX_HLT"))
+_IC_FB = (ic("SOLO_OFF"), ic("SOLO_ON"))
+_IC_EYE = (ic("HIDE_ON"), ic("HIDE_OFF"))
+
+
 def ic_rb(value):
-    return ic("RADIOBUT_ON" if value else "RADIOBUT_OFF")
+    return _IC_RB[bool(value)]
 
 
 def ic_cb(value):
-    return ic("CHECKBOX_HLT" if value else "CHECKBOX_DEHLT")
+    return _IC_CB[bool(value)]
 
 
 def ic_fb(value):
-    return ic("SOLO_ON" if value else "SOLO_OFF")
+    return _IC_FB[bool(value)]
 
 
 def ic_eye(value):
-    return ic("HIDE_OFF" if value else "HIDE_ON")
+    return _IC_EYE[bool(value)]
+
+
+# placeholder 引数は 4.1 以降のみ対応のため、バージョン判定は読み込み時に一度だけ行う
+_STRIP_PLACEHOLDER = BL_VERSION < (4, 1, 0)
 
 
 def ui_prop(layout, data, property, **kwargs):
-    if BL_VERSION < (4, 1, 0) and "placeholder" in kwargs:
-        del kwargs["placeholder"]
+    if _STRIP_PLACEHOLDER:
+        kwargs.pop("placeholder", None)
 
     layout.prop(data, property, **kwargs)
 
 
+# 長い単語を含む行の折り返し用（ハイフン位置での分割は不要なので無効化）
+# fill() のように呼び出しごとに TextWrapper を生成しないよう使い回す
+_WRAPPER = textwrap.TextWrapper(break_on_hyphens=False)
+# 単純な積み上げでは textwrap と結果が変わる行（タブ等の空白や連続スペース）の検出用
+_WRAPPER_ONLY = re.compile(r"[\t\n\x0b\x0c\r]| {2}")
+
+
+# ui_multiline_text() の align 引数 -> row.alignment（未知の値は LEFT）
+_ALIGN = {"LEFT": "LEFT", "CENTER": "CENTER", "RIGHT": "RIGHT"}
+
+
+# SECONDARY テキストを行内のサブ行に描画するか（False なら行自体を縮小して描画）
+_SECONDARY_USE_SUBROW = False
+
+
+@functools.lru_cache(maxsize=512)
+def _wrap_lines(text, wrap_width):
+    """
+    テキストを改行文字と指定幅で行に分割する
+
+    Returns:
+        前後の空白を除いた表示用の行のタプル（キャッシュ共有のため不変）
+    """
+    formatted_lines = []
+    for line in text.split("\n"):
+        if len(line) <= wrap_width:
+            formatted_lines.append(line)
+        else:
+            formatted_lines.extend(_wrap_line(line, wrap_width))
+    return tuple(line.strip() for line in formatted_lines)
+
+
+def _wrap_line(line, width):
+    """
+    1行を単語単位で指定幅に折り返す
+
+    単語の長さを積み上げ、幅を超えた時点で次の行に送る。
+    区切りは textwrap と同じく ASCII スペースのみ（全角スペース等では改行しない）。
+    タブや連続スペースを含む行、幅を超える単語や空白だけの単語がある行は
+    _WRAPPER に任せる。
+    """
+    _WRAPPER.width = width
+    if _WRAPPER_ONLY.search(line):
+        return _WRAPPER.wrap(line) or [""]
+
+    out = []
+    cur = []
+    cur_len = 0
+    for word in line.split(" "):
+        if not word:
+            continue
+        word_len = len(word)
+        if word_len > width or word.isspace():
+            # 全角スペースだけの単語は textwrap が行頭・行末で落とすため任せる
+            return _WRAPPER.wrap(line) or [""]
+
+        if cur and cur_len + 1 + word_len > width:
+            out.append(" ".join(cur))
+            cur = [word]
+            cur_len = word_len
+        else:
+            cur.append(word)
+            cur_len += word_len + (1 if cur_len else 0)
+
+    if cur or not out:
+        out.append(" ".join(cur))
+    return out
+
+
 def ui_multiline_text(
     layout,
     text,
@@ -142,66 +239,64 @@ def ui_multiline_text(
     if not text:
         return
 
-    # テキストを行に分割
-    lines = text.split("\n")
-
-    # 各行をさらに指定された幅で自動改行
-    formatted_lines = []
-    for line in lines:
-        if len(line) <= wrap_width:
-            formatted_lines.append(line)
-        else:
-            # textwrapを使用して適切に改行
-            wrapped = textwrap.fill(line, width=wrap_width)
-            formatted_lines.extend(wrapped.split("\n"))
-
-    # 各行を表示
-    for i, line in enumerate(formatted_lines):
-        if spacing and i > 0:
-            layout.separator(factor=0.1)
-
-        # インデントが指定されている場合、インデントレイアウトを使用
-        if indent > 0:
-            current_layout = _indented_layout(layout, indent)
-        else:
-            current_layout = layout
-
-        # 行のレイアウトを作成
-        row = current_layout.row()
-
-        # 配置を設定
-        if align == "CENTER":
-            row.alignment = "CENTER"
-        elif align == "RIGHT":
-            row.alignment = "RIGHT"
-        else:
-            row.alignment = "LEFT"
-
-        # テキスト色の設定
-        if text_color == "WARNING":
-            row.alert = True
-        elif text_color == "ERROR":
-            row.alert = True
-
-        # 最初の行のみアイコンを表示、それ以降は None
-        current_icon = (
-            ic(icon) if (i == 0 and icon and ic(icon) != "BLENDER") else "BLANK1"
-        )
+    if "\n" not in text and len(text) <= wrap_width:
+        # 改行も折り返しも不要な短いテキストはそのまま1行で表示
+        formatted_lines = (text.strip(),)
+    else:
+        # 改行済みの行はテキストと幅ごとにキャッシュされる（再描画のたびに折り返さない）
+        formatted_lines = _wrap_lines(text, wrap_width)
+
+    # 行ごとに変わらない設定はループの前に一度だけ求める
+    align_val = _ALIGN.get(align, "LEFT")
+    alert_flag = text_color in ("WARNING", "ERROR")
+    is_secondary = text_color == "SECONDARY"
+    resolved_icon = ic(icon) if icon else None
+    first_icon = (
+        resolved_icon if resolved_icon and resolved_icon != "BLENDER" else "BLANK1"
+    )
 
-        # テキストを表示
-        if text_color == "SECONDARY":
-            # セカンダリテキストの場合は少し暗く表示
-            sub_row = row.row()
-            sub_row.scale_y = 0.9
-            if current_icon:
-                sub_row.label(text=line.strip(), icon=current_icon)
-            else:
-                sub_row.label(text=line.strip())
-        else:
-            if current_icon:
-                row.label(text=line.strip(), icon=current_icon)
+    # インデントが指定されている場合、全行を1つのインデントレイアウトにまとめる
+    current_layout = _indented_layout(layout, indent) if indent > 0 else layout
+
+    if align_val == "LEFT" and not is_secondary and not spacing:
+        # 行レイアウトが不要な場合は、詰めたカラムにラベルを直接並べる
+        col = current_layout.column(align=True)
+        if alert_flag:
+            col.alert = True
+        label = col.label
+        for i, line in enumerate(formatted_lines):
+            label(text=line, icon=first_icon if i == 0 else "BLANK1")
+    else:
+        # ループ内で繰り返し呼ぶメソッドはローカルに束縛しておく
+        separator = current_layout.separator
+        make_row = current_layout.row
+
+        # 各行を表示
+        for i, line in enumerate(formatted_lines):
+            if spacing and i > 0:
+                separator(factor=0.1)
+
+            # 行のレイアウトを作成
+            row = make_row()
+            row.alignment = align_val
+            if alert_flag:
+                row.alert = True
+
+            # 最初の行のみアイコンを表示、それ以降は空白アイコンで揃える
+            current_icon = first_icon if i == 0 else "BLANK1"
+
+            # テキストを表示
+            if is_secondary:
+                # セカンダリテキストの場合は少し暗く表示
+                if _SECONDARY_USE_SUBROW:
+                    sub_row = row.row()
+                    sub_row.scale_y = 0.9
+                    sub_row.label(text=line, icon=current_icon)
+                else:
+                    row.scale_y = 0.9
+                    row.label(text=line, icon=current_icon)
             else:
-                row.label(text=line.strip())
+                row.label(text=line, icon=current_icon)
 
     # クリップボードコピーボタンを表示
     if show_copy_button:
@@ -210,12 +305,13 @@ def ui_multiline_text(
         copy_row.scale_y = 0.8
         copy_row.scale_x = 0.8
 
-        copy_op = copy_row.operator(
-            CopyTextToClipboardOperator.bl_idname, text="", icon="COPYDOWN"
-        )
+        copy_op = copy_row.operator(_COPY_IDNAME, text="", icon="COPYDOWN")
         copy_op.text = text
 
 
+_panel_id_cache = {}  # ui_text_block() のタイトル -> デフォルトのパネルID
+
+
 def ui_text_block(
     layout,
     title,
@@ -242,12 +338,14 @@ def ui_text_block(
     if collapsible:
         # 折りたたみ可能なパネル
         if not panel_id:
-            # デフォルトのパネルIDを生成
-            panel_id = (
-                f"TEXT_BLOCK_{title.replace(' ', '_').upper()}"
-                if title
-                else "TEXT_BLOCK_DEFAULT"
-            )
+            # デフォルトのパネルIDを生成（タイトルごとにキャッシュ）
+            panel_id = _panel_id_cache.get(title)
+            if panel_id is None:
+                panel_id = _panel_id_cache[title] = (
+                    f"TEXT_BLOCK_{title.replace(' ', '_').upper()}"
+                    if title
+                    else "TEXT_BLOCK_DEFAULT"
+                )
 
         # Blenderのpanel()メソッドを使用
         header_layout, body_layout = layout.panel(
@@ -286,6 +384,9 @@ def ui_help_text(layout, text, icon="INFO", show_copy_button=True, **kwargs):
     """
     ヘルプテキスト用のプリセット
     """
+    if not text:
+        return
+
     ui_multiline_text(
         layout,
         text,
@@ -301,6 +402,9 @@ def ui_warning_text(layout, text, icon="ERROR", show_copy_button=False, **kwargs
     """
     警告テキスト用のプリセット
     """
+    if not text:
+        return
+
     ui_multiline_text(
         layout,
         text,
@@ -315,6 +419,9 @@ def ui_error_text(layout, text, icon="CANCEL", show_copy_button=False, **kwargs)
     """
     エラーテキスト用のプリセット
     """
+    if not text:
+        return
+
     ui_multiline_text(
         layout,
         text,